@@ -528,7 +528,10 @@ class ComparerCollection(Mapping, Scoreable):
         agg_cols = _parse_groupby(by, n_mod=cc.n_models, n_qnt=cc.n_quantities)
         agg_cols, attrs_keys = self._attrs_keys_in_by(agg_cols)
 
-        df = cc._to_long_dataframe(attrs_keys=attrs_keys, observed=observed)
+        needed = [b for b in agg_cols if isinstance(b, str)]
+        df = cc._to_long_dataframe(
+            attrs_keys=attrs_keys, observed=observed, needed=needed
+        )
 
         res = _groupby_df(df, by=agg_cols, metrics=pmetrics)
         mtr_cols = [m.__name__ for m in pmetrics]  # type: ignore
@@ -538,12 +541,15 @@ class ComparerCollection(Mapping, Scoreable):
         return SkillTable(res)
 
     def _to_long_dataframe(
-        self, attrs_keys: Iterable[str] | None = None, observed: bool = False
+        self,
+        attrs_keys: Iterable[str] | None = None,
+        observed: bool = False,
+        needed: Iterable[str] | None = None,
     ) -> pd.DataFrame:
         """Return a copy of the data as a long-format pandas DataFrame (for groupby operations)"""
         frames = []
         for cmp in self:
-            frame = cmp._to_long_dataframe(attrs_keys=attrs_keys)
+            frame = cmp._to_long_dataframe(attrs_keys=attrs_keys, needed=needed)
             if self.n_quantities > 1:
                 frame["quantity"] = cmp.quantity.name
             frames.append(frame)
@@ -600,9 +606,9 @@ class ComparerCollection(Mapping, Scoreable):
             if (field == "quantity") and (self.n_quantities <= 1):
                 continue
             if field not in skilldf.index.names:
-                unames = df[field].unique()
-                if len(unames) == 1:
-                    skilldf.insert(loc=0, column=field, value=unames[0])
+                # nunique avoids allocating the unique-values array
+                if df[field].nunique(dropna=False) == 1:
+                    skilldf.insert(loc=0, column=field, value=df[field].iat[0])
         return skilldf
 
     def gridded_skill(
@@ -694,15 +700,16 @@ class ComparerCollection(Mapping, Scoreable):
 
         metrics = _parse_metric(metrics)
 
-        df = cmp._to_long_dataframe()
-        df = _add_spatial_grid_to_df(df=df, bins=bins, binsize=binsize)
-
         agg_cols = _parse_groupby(by, n_mod=cmp.n_models, n_qnt=cmp.n_quantities)
         if "x" not in agg_cols:
             agg_cols.insert(0, "x")
         if "y" not in agg_cols:
             agg_cols.insert(0, "y")
 
+        needed = ["x", "y", *(b for b in agg_cols if isinstance(b, str))]
+        df = cmp._to_long_dataframe(needed=needed)
+        df = _add_spatial_grid_to_df(df=df, bins=bins, binsize=binsize)
+
         df = df.drop(columns=["x", "y"]).rename(columns=dict(xBin="x", yBin="y"))
         res = _groupby_df(df, by=agg_cols, metrics=metrics, n_min=n_min)
         ds = res.to_xarray().squeeze()
@@ -809,7 +816,7 @@ class ComparerCollection(Mapping, Scoreable):
         agg = {"n": "sum"}
         for metric in pmetrics:  # type: ignore
             agg[metric.__name__] = weighted_mean  # type: ignore
-        res = skilldf.groupby(by, observed=False).agg(agg)
+        res = skilldf.groupby(by, observed=False, sort=False).agg(agg)
 
         # TODO is this correct?
         res.index.name = "model"
@@ -997,13 +1004,11 @@ class ComparerCollection(Mapping, Scoreable):
         weights = kwargs.pop("weights", None)
 
         metric = _parse_metric(metric)[0]
+        metric_name = metric.__name__  # normalized by _parse_metric
 
         if weights is None:
             weights = {c.name: c.weight for c in self._comparers.values()}
 
-        if not (callable(metric) or isinstance(metric, str)):
-            raise ValueError("metric must be a string or a function")
-
         model, start, end, area = _get_deprecated_args(kwargs)  # type: ignore
         observation, variable = _get_deprecated_obs_var_args(kwargs)  # type: ignore
         assert kwargs == {}, f"Unknown keyword arguments: {kwargs}"
@@ -1032,7 +1037,6 @@ class ComparerCollection(Mapping, Scoreable):
         sk = cmp.mean_skill(weights=weights, metrics=[metric])
         df = sk.to_dataframe()
 
-        metric_name = metric if isinstance(metric, str) else metric.__name__
         ser = df[metric_name]
         score = {str(col): float(value) for col, value in ser.items()}
 
@@ -948,12 +948,22 @@ class Comparer(Scoreable):
         return Comparer.from_matched_data(d, self.raw_mod_data)
 
     def _to_long_dataframe(
-        self, attrs_keys: Iterable[str] | None = None
+        self,
+        attrs_keys: Iterable[str] | None = None,
+        needed: Iterable[str] | None = None,
     ) -> pd.DataFrame:
         """Return a copy of the data as a long-format pandas DataFrame (for groupby operations)"""
 
         data = self.data.drop_vars("z", errors="ignore")
 
+        if needed is not None:
+            # drop variables never consumed downstream *before* materializing
+            # the dataframe (obs and model values are always kept)
+            keep = {self._obs_str, *self.mod_names, *needed}
+            data = data.drop_vars(
+                [v for v in data.variables if v not in keep and v not in data.dims]
+            )
+
         # this step is necessary since we keep arbitrary derived data in the dataset, but not z
         # i.e. using a hardcoded whitelist of variables to keep is less flexible
         id_vars = [v for v in data.variables if v not in self.mod_names]
@@ -1045,7 +1055,7 @@ class Comparer(Scoreable):
 
         by = _parse_groupby(by, n_mod=cmp.n_models, n_qnt=1)
 
-        df = cmp._to_long_dataframe()
+        df = cmp._to_long_dataframe(needed=[b for b in by if isinstance(b, str)])
         res = _groupby_df(df, by=by, metrics=metrics)
         res["x"] = np.nan if self.gtype == "track" else cmp.x
         res["y"] = np.nan if self.gtype == "track" else cmp.y
@@ -1062,9 +1072,9 @@ class Comparer(Scoreable):
             if (field == "model") and (self.n_models <= 1):
                 continue
             if field not in skilldf.index.names:
-                unames = df[field].unique()
-                if len(unames) == 1:
-                    skilldf.insert(loc=0, column=field, value=unames[0])
+                # nunique avoids allocating the unique-values array
+                if df[field].nunique(dropna=False) == 1:
+                    skilldf.insert(loc=0, column=field, value=df[field].iat[0])
         return skilldf
 
     def score(
@@ -1100,8 +1110,7 @@ class Comparer(Scoreable):
         {'mod': 11.567399646108198}
         """
         metric = _parse_metric(metric)[0]
-        if not (callable(metric) or isinstance(metric, str)):
-            raise ValueError("metric must be a string or a function")
+        metric_name = metric.__name__  # normalized by _parse_metric
 
         # TODO remove in v1.1
         model, start, end, area = _get_deprecated_args(kwargs)  # type: ignore
@@ -1117,8 +1126,11 @@ class Comparer(Scoreable):
         )
         df = sk.to_dataframe()
 
-        metric_name = metric if isinstance(metric, str) else metric.__name__
-        ser = df.reset_index().groupby("model", observed=True)[metric_name].mean()
+        ser = (
+            df.reset_index()
+            .groupby("model", observed=True, sort=False)[metric_name]
+            .mean()
+        )
         score = {str(k): float(v) for k, v in ser.items()}
         return score
 
@@ -1201,15 +1213,16 @@ class Comparer(Scoreable):
         if cmp.n_points == 0:
             raise ValueError("No data to compare")
 
-        df = cmp._to_long_dataframe()
-        df = _add_spatial_grid_to_df(df=df, bins=bins, binsize=binsize)
-
         agg_cols = _parse_groupby(by=by, n_mod=cmp.n_models, n_qnt=1)
         if "x" not in agg_cols:
             agg_cols.insert(0, "x")
         if "y" not in agg_cols:
             agg_cols.insert(0, "y")
 
+        needed = ["x", "y", *(b for b in agg_cols if isinstance(b, str))]
+        df = cmp._to_long_dataframe(needed=needed)
+        df = _add_spatial_grid_to_df(df=df, bins=bins, binsize=binsize)
+
         df = df.drop(columns=["x", "y"]).rename(columns=dict(xBin="x", yBin="y"))
         res = _groupby_df(df, by=agg_cols, metrics=metrics, n_min=n_min)
         ds = res.to_xarray().squeeze()
@@ -1238,12 +1251,17 @@ class Comparer(Scoreable):
                 mod_name = cmp.mod_names[j]
                 mod_ts = cmp.raw_mod_data[mod_name]
                 with xr.set_options(keep_attrs=True):  # type: ignore
-                    mod_ts.data[mod_name].values = mod_ts.values - bias[j]
-                    cmp.data[mod_name].values = cmp.data[mod_name].values - bias[j]
+                    # in-place subtraction avoids allocating new arrays
+                    raw_arr = mod_ts.data[mod_name].values
+                    np.subtract(raw_arr, bias[j], out=raw_arr)
+                    arr = cmp.data[mod_name].values
+                    if not np.shares_memory(arr, raw_arr):
+                        np.subtract(arr, bias[j], out=arr)
         elif correct == "Observation":
             # what if multiple models?
             with xr.set_options(keep_attrs=True):  # type: ignore
-                cmp.data[cmp._obs_str].values = cmp.data[cmp._obs_str].values + bias
+                obs_arr = cmp.data[cmp._obs_str].values
+                np.add(obs_arr, bias, out=obs_arr)
         else:
             raise ValueError(
                 f"Unknown correct={correct}. Only know 'Model' and 'Observation'"
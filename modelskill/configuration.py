@@ -4,6 +4,11 @@ import pandas as pd
 import yaml
 from typing import Union
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C scanner
+except ImportError:
+    from yaml import FullLoader as _YamlLoader  # type: ignore[assignment]
+
 from . import model_result, match, Quantity
 from .obs import PointObservation, TrackObservation
 from .comparison import ComparerCollection
@@ -85,8 +90,8 @@ def _obs_from_dict(
 
 def _yaml_to_dict(filename: Path) -> dict:
     with open(filename) as f:
-        contents = f.read()
-    conf = yaml.load(contents, Loader=yaml.FullLoader)
+        # pass the file object directly so libyaml can stream the input
+        conf = yaml.load(f, Loader=_YamlLoader)
     return conf
 
 
@@ -101,11 +106,19 @@ def _excel_to_dict(filename: Path) -> dict:
     return conf
 
 
+def _notna(v) -> bool:
+    if isinstance(v, float):
+        return v == v  # False only for NaN
+    if not hasattr(v, "__len__"):
+        return bool(pd.notna(v))
+    return pd.Series(v).notna().all()
+
+
 def _remove_keys_w_nan_value(d: dict) -> dict:
     """Loops through dicts in dict and removes all entries where value is NaN
     e.g. x,y values of TrackObservations
     """
     dout = {}
     for key, subdict in d.items():
-        dout[key] = {k: v for k, v in subdict.items() if pd.Series(v).notna().all()}
+        dout[key] = {k: v for k, v in subdict.items() if _notna(v)}
     return dout
@@ -1,5 +1,7 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import partial
 from pathlib import Path
 import warnings
 
@@ -29,6 +31,7 @@ from .timeseries import TimeSeries
 from .types import Period
 from .model._base import Alignable
 from .model.grid import GridModelResult
+from .model.point import PointModelResult
 from .model.dfsu import DfsuModelResult
 from .model.track import TrackModelResult
 from .model.dummy import DummyModelResult
@@ -67,6 +70,10 @@ ObsInputType = Union[
     Observation,
 ]
 
+# isinstance-ready tuples; get_args allocates a fresh tuple on every call
+_MR_INPUT_TYPES = get_args(MRInputType)
+_OBS_INPUT_TYPES = get_args(ObsInputType)
+
 T = TypeVar("T", bound="TimeSeries")
 
 
@@ -172,6 +179,7 @@ def match(
     gtype: Optional[GeometryTypes] = None,
     max_model_gap: Optional[float] = None,
     spatial_method: Optional[str] = None,
+    n_workers: Optional[int] = None,
 ) -> Comparer: ...
 
 
@@ -185,6 +193,7 @@ def match(
     gtype: Optional[GeometryTypes] = None,
     max_model_gap: Optional[float] = None,
     spatial_method: Optional[str] = None,
+    n_workers: Optional[int] = None,
 ) -> ComparerCollection: ...
 
 
@@ -197,6 +206,7 @@ def match(
     gtype=None,
     max_model_gap=None,
     spatial_method: Optional[str] = None,
+    n_workers: Optional[int] = None,
 ):
     """Match observation and model result data in space and time
 
@@ -230,6 +240,10 @@ def match(
         'inverse_distance' (with 5 nearest points), by default "inverse_distance".
         - For GridModelResult, passed to xarray.interp() as method argument,
         by default 'linear'.
+    n_workers : int, optional
+        Number of worker threads used to match multiple observations in
+        parallel (extraction releases the GIL in xarray/numpy),
+        by default None (match observations sequentially)
 
     Returns
     -------
@@ -243,7 +257,7 @@ def match(
     [from_matched][modelskill.from_matched]
         Create a Comparer from observation and model results that are already matched
     """
-    if isinstance(obs, get_args(ObsInputType)):
+    if isinstance(obs, _OBS_INPUT_TYPES):
         return _single_obs_compare(
             obs,
             mod,
@@ -270,18 +284,21 @@ def match(
                 """
             )
 
-    clist = [
-        _single_obs_compare(
-            o,
-            mod,
-            obs_item=obs_item,
-            mod_item=mod_item,
-            gtype=gtype,
-            max_model_gap=max_model_gap,
-            spatial_method=spatial_method,
-        )
-        for o in obs
-    ]
+    single = partial(
+        _single_obs_compare,
+        mod=mod,
+        obs_item=obs_item,
+        mod_item=mod_item,
+        gtype=gtype,
+        max_model_gap=max_model_gap,
+        spatial_method=spatial_method,
+    )
+
+    if n_workers is not None and n_workers > 1 and len(obs) > 1:
+        with ThreadPoolExecutor(max_workers=min(n_workers, len(obs))) as executor:
+            clist = list(executor.map(single, obs))
+    else:
+        clist = [single(o) for o in obs]
 
     return ComparerCollection(clist)
 
@@ -296,7 +313,7 @@ def compare(
     max_model_gap=None,
 ) -> ComparerCollection:
     warnings.warn("compare is deprecated. Use match instead.", FutureWarning)
-    observations = [obs] if isinstance(obs, get_args(ObsInputType)) else obs
+    observations = [obs] if isinstance(obs, _OBS_INPUT_TYPES) else obs
     assert isinstance(observations, Iterable)
 
     clist = [
@@ -387,24 +404,39 @@ def match_space_time(
     data.attrs["name"] = observation.name
     data = data.rename({observation.name: "Observation"})
 
+    taken_names = set(data.data_vars)
+    aligned_all = []
     for mr in raw_mod_data.values():
         # TODO is `align` the correct name for this operation?
         aligned = mr.align(observation, max_gap=max_model_gap)
 
-        if overlapping_names := set(aligned.data_vars) & set(data.data_vars):
+        if overlapping_names := set(aligned.data_vars) & taken_names:
             warnings.warn(
                 "Model result has overlapping variable names with observation. Renamed with suffix `_model`."
             )
             aligned = aligned.rename({v: f"{v}_mod" for v in overlapping_names})
 
-        data.update(aligned)
+        taken_names.update(aligned.data_vars)
+        aligned_all.append(aligned)
 
-    # drop NaNs in model and observation columns (but allow NaNs in aux columns)
-    def mo_kind(k: str) -> bool:
-        return k in ["model", "observation"]
+    # single update so the obs time axis is aligned once, not once per model
+    if len(aligned_all) == 1:
+        data.update(aligned_all[0])
+    else:
+        merged = xr.merge(aligned_all, compat="override", join="outer")
+        # sequential updates let the last model result win coord conflicts
+        merged = merged.assign_coords(
+            {k: c for k, c in aligned_all[-1].coords.items() if "time" not in c.dims}
+        )
+        data.update(merged)
 
+    # drop NaNs in model and observation columns (but allow NaNs in aux columns)
     # TODO mo_cols vs non_aux_cols?
-    mo_cols = data.filter_by_attrs(kind=mo_kind).data_vars
+    mo_cols = [
+        v
+        for v in data.data_vars
+        if data[v].attrs.get("kind") in ("model", "observation")
+    ]
     data = data.dropna(dim="time", subset=mo_cols)
 
     return data
@@ -432,7 +464,7 @@ def _parse_models(
     gtype: Optional[GeometryTypes] = None,
 ) -> List[Any]:  # TODO
     """Return a list of ModelResult objects"""
-    if isinstance(mod, get_args(MRInputType)):
+    if isinstance(mod, _MR_INPUT_TYPES):
         return [_parse_single_model(mod, item=item, gtype=gtype)]
     elif isinstance(mod, Sequence):
         return [_parse_single_model(m, item=item, gtype=gtype) for m in mod]
@@ -440,25 +472,42 @@ def _parse_models(
         raise ValueError(f"Unknown mod type {type(mod)}")
 
 
+# raw inputs that must go through the model_result factory; hoisted so
+# _parse_single_model does not rebuild the tuple per model in a list
+_RAW_MODEL_INPUT_TYPES = (
+    str,
+    Path,
+    pd.DataFrame,
+    xr.Dataset,
+    xr.DataArray,
+    mikeio.Dfs0,
+    mikeio.Dataset,
+    mikeio.DataArray,
+    mikeio.dfsu.Dfsu2DH,
+)
+
+# already-constructed model results pass through unchanged; an exact-type
+# set gives an O(1) check for the common case
+_MODEL_RESULT_TYPES = {
+    GridModelResult,
+    DfsuModelResult,
+    TrackModelResult,
+    PointModelResult,
+    DummyModelResult,
+}
+
+
 def _parse_single_model(
     mod: Any,  # TODO
     item: Optional[IdxOrNameTypes] = None,
     gtype: Optional[GeometryTypes] = None,
 ) -> Any:  # TODO
-    if isinstance(
-        mod,
-        (
-            str,
-            Path,
-            pd.DataFrame,
-            xr.Dataset,
-            xr.DataArray,
-            mikeio.Dfs0,
-            mikeio.Dataset,
-            mikeio.DataArray,
-            mikeio.dfsu.Dfsu2DH,
-        ),
-    ):
+    if type(mod) in _MODEL_RESULT_TYPES:
+        if item is not None:
+            raise ValueError("item argument not allowed if mod is a ModelResult type")
+        return mod
+
+    if isinstance(mod, _RAW_MODEL_INPUT_TYPES):
         try:
             return model_result(mod, item=item, gtype=gtype)
         except ValueError as e:
@@ -694,11 +694,13 @@ def _linear_regression(
         return np.nan, np.nan  # TODO raise error?
 
     if reg_method == "ols":
-        from scipy.stats import linregress as _linregress
-
-        reg = _linregress(obs, model)
-        intercept = reg.intercept
-        slope = reg.slope
+        # direct dot-product OLS; scipy.stats.linregress also computes
+        # r-value, p-value and stderr which are discarded here
+        obs_mean = obs.mean()
+        model_mean = model.mean()
+        obs_dev = obs - obs_mean
+        slope = np.dot(obs_dev, model - model_mean) / np.dot(obs_dev, obs_dev)
+        intercept = model_mean - slope * obs_mean
     elif reg_method == "odr":
         from scipy import odr
 
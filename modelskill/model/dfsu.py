@@ -14,6 +14,9 @@ from .point import PointModelResult
 from .track import TrackModelResult
 from ..obs import Observation, PointObservation, TrackObservation
 
+# isinstance-ready tuple; get_args allocates a fresh tuple on every call
+_UNSTRUCTURED_TYPES = get_args(UnstructuredType)
+
 
 class DfsuModelResult(SpatialField):
     """Construct a DfsuModelResult from a dfsu file or mikeio.Dataset/DataArray.
@@ -47,7 +50,7 @@ class DfsuModelResult(SpatialField):
         filename = None
 
         assert isinstance(
-            data, get_args(UnstructuredType)
+            data, _UNSTRUCTURED_TYPES
         ), "Could not construct DfsuModelResult from provided data"
 
         if isinstance(data, (str, Path)):
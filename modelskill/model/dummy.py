@@ -2,7 +2,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
+import xarray as xr
 
 from modelskill.model.point import PointModelResult
 from modelskill.model.track import TrackModelResult
@@ -55,13 +57,19 @@ class DummyModelResult:
                 "spatial interpolation not possible when matching point model results with point observations"
             )
 
-        da = observation.data[observation.name].copy()
-        if self.strategy == "mean":
-            da[:] = da.mean()
-        else:
-            da[:] = self.data
+        orig = observation.data[observation.name]
+        fill = float(orig.mean()) if self.strategy == "mean" else self.data
+        # fill a fresh array instead of copying values that are overwritten anyway
+        values = np.full(orig.shape, fill, dtype=orig.dtype)
 
         if isinstance(observation, PointObservation):
+            da = xr.DataArray(
+                values,
+                coords=orig.coords,
+                dims=orig.dims,
+                attrs=orig.attrs,
+                name=orig.name,
+            )
             return PointModelResult(
                 data=da, x=observation.x, y=observation.y, name=self.name
             )
@@ -71,9 +79,9 @@ class DummyModelResult:
                 {
                     "x": observation.x,
                     "y": observation.y,
-                    "value": da.values,
+                    "value": values,
                 },
-                index=da.time,
+                index=orig.time,
             )
             return TrackModelResult(data=data, name=self.name)
         else:
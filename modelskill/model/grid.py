@@ -1,7 +1,9 @@
 from __future__ import annotations
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Sequence, get_args
+from typing import Optional, Sequence
 
+import numpy as np
 import pandas as pd
 import xarray as xr
 
@@ -14,6 +16,27 @@ from .track import TrackModelResult
 from ..obs import PointObservation, TrackObservation
 
 
+try:
+    import dask  # noqa: F401
+
+    # parallel file opens and auto time-chunking need dask; without it
+    # open_mfdataset falls back to serial opens of in-memory datasets
+    _MFDATASET_KWARGS: dict = dict(parallel=True, chunks={"time": "auto"})
+except ImportError:
+    _MFDATASET_KWARGS = {}
+
+
+def _open_mfdataset(data) -> xr.Dataset:
+    return xr.open_mfdataset(data, combine="by_coords", **_MFDATASET_KWARGS)
+
+
+def _dropna_if_needed(df: pd.DataFrame) -> pd.DataFrame:
+    """Like DataFrame.dropna but skips the row-filter pass for dense data"""
+    if any(np.isnan(df[c].values).any() for c in df.columns):
+        return df.dropna()
+    return df
+
+
 class GridModelResult(SpatialField):
     """Construct a GridModelResult from a file or xarray.Dataset.
 
@@ -42,13 +65,11 @@ class GridModelResult(SpatialField):
         quantity: Optional[Quantity] = None,
         aux_items: Optional[list[int | str]] = None,
     ) -> None:
-        assert isinstance(
-            data, get_args(GridType)
-        ), "Could not construct GridModelResult from provided data."
-
+        # no isinstance precheck against GridType: the dispatch below covers
+        # every accepted type and ends in NotImplementedError
         if isinstance(data, (str, Path)):
             if "*" in str(data):
-                ds = xr.open_mfdataset(data)
+                ds = _open_mfdataset(data)
             else:
                 assert Path(data).exists(), f"{data}: File does not exist."
                 ds = xr.open_dataset(data)
@@ -56,7 +77,7 @@ class GridModelResult(SpatialField):
         elif isinstance(data, Sequence) and all(
             isinstance(file, (str, Path)) for file in data
         ):
-            ds = xr.open_mfdataset(data)
+            ds = _open_mfdataset(data)
 
         elif isinstance(data, xr.DataArray):
             if item is not None:
@@ -84,6 +105,17 @@ class GridModelResult(SpatialField):
         self.name = name
         self.sel_items = sel_items
 
+        # domain bounds are invariant; cache to avoid a bbox scan per extract
+        assert hasattr(self.data, "x") and hasattr(
+            self.data, "y"
+        ), "Data has no x and/or y coordinates."
+        self._xmin, self._xmax = self._coord_bounds(self.data.x.values)
+        self._ymin, self._ymax = self._coord_bounds(self.data.y.values)
+
+        # uniformly spaced axes admit closed-form nearest-index math
+        self._x_axis = self._uniform_axis(self.data.x.values)
+        self._y_axis = self._uniform_axis(self.data.y.values)
+
         # use long_name and units from data if not provided
         if quantity is None:
             da = self.data[sel_items.values]
@@ -100,19 +132,43 @@ class GridModelResult(SpatialField):
             res.append(f"Auxiliary variables: {', '.join(self.sel_items.aux)}")
         return "\n".join(res)
 
-    @property
+    @staticmethod
+    def _uniform_axis(vals: np.ndarray) -> Optional[tuple[float, float, int]]:
+        """(origin, spacing, size) if the axis is 1D and uniformly spaced"""
+        if vals.ndim != 1 or len(vals) < 2:
+            return None
+        steps = np.diff(vals)
+        if not np.allclose(steps, steps[0]):
+            return None
+        return float(vals[0]), float(steps[0]), len(vals)
+
+    @staticmethod
+    def _nearest_index(q: float, v0: float, dv: float, n: int) -> int:
+        """Closed-form nearest index on a uniform axis; halfway points
+        round to the larger coordinate value like sel's nearest lookup"""
+        f = (q - v0) / dv
+        i = np.floor(f + 0.5) if dv > 0 else np.ceil(f - 0.5)
+        return min(max(int(i), 0), n - 1)
+
+    @staticmethod
+    def _coord_bounds(vals: np.ndarray) -> tuple[float, float]:
+        """Coordinate range; O(1) endpoint reads for 1D (monotonic) coords"""
+        if vals.ndim == 1 and len(vals) > 1:
+            first, last = float(vals[0]), float(vals[-1])
+            return (first, last) if first <= last else (last, first)
+        return float(vals.min()), float(vals.max())
+
+    @cached_property
     def time(self) -> pd.DatetimeIndex:
         return pd.DatetimeIndex(self.data.time)
 
     def _in_domain(self, x: float, y: float) -> bool:
-        assert hasattr(self.data, "x") and hasattr(
-            self.data, "y"
-        ), "Data has no x and/or y coordinates."
-        xmin = float(self.data.x.values.min())
-        xmax = float(self.data.x.values.max())
-        ymin = float(self.data.y.values.min())
-        ymax = float(self.data.y.values.max())
-        return (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        return (
+            (x >= self._xmin)
+            & (x <= self._xmax)
+            & (y >= self._ymin)
+            & (y <= self._ymax)
+        )
 
     def extract(
         self,
@@ -146,14 +202,45 @@ class GridModelResult(SpatialField):
                 f"Extraction from {type(self.data)} to {type(observation)} is not implemented."
             )
 
-    def _extract_point(
-        self, observation: PointObservation, spatial_method: Optional[str] = None
-    ) -> PointModelResult:
-        """Spatially extract a PointModelResult from a GridModelResult (when data is a xarray.Dataset),
-        given a PointObservation. No time interpolation is done!"""
+    def extract_points(
+        self,
+        observations: Sequence[PointObservation],
+        spatial_method: Optional[str] = None,
+    ) -> list[PointModelResult]:
+        """Extract ModelResult at multiple point observation positions at once
+
+        A single vectorized interp call is made for all positions, which
+        amortizes the spatial interpolation setup cost across observations.
+
+        Parameters
+        ----------
+        observations : Sequence[PointObservation]
+            positions at which modelresult should be extracted
+        spatial_method : Optional[str], optional
+            method in xarray.Dataset.interp, typically either "nearest" or
+            "linear", by default None = 'linear'
+
+        Returns
+        -------
+        list[PointModelResult]
+            extracted modelresults, one per observation
+        """
         method: str = spatial_method or "linear"
 
-        x, y, z = observation.x, observation.y, observation.z
+        for obs in observations:
+            self._validate_point_position(obs)
+
+        x = xr.DataArray([obs.x for obs in observations], dims="station")
+        y = xr.DataArray([obs.y for obs in observations], dims="station")
+        ds = self.data.interp(coords=dict(x=x, y=y), method=method)  # type: ignore
+
+        return [
+            self._point_result_from_ds(ds.isel(station=i), obs.name)
+            for i, obs in enumerate(observations)
+        ]
+
+    def _validate_point_position(self, observation: PointObservation) -> None:
+        x, y = observation.x, observation.y
         if (x is None) or (y is None):
             raise ValueError(
                 f"PointObservation '{observation.name}' cannot be used for extraction "
@@ -165,22 +252,20 @@ class GridModelResult(SpatialField):
                 f"PointObservation '{observation.name}' ({x}, {y}) is outside model domain!"
             )
 
-        assert isinstance(self.data, xr.Dataset)
-
-        # TODO: avoid runtrip to pandas if possible (potential loss of metadata)
-        if "z" in self.data.dims and z is not None:
-            ds = self.data.interp(
-                coords=dict(x=x, y=y, z=z), method=method  # type: ignore
-            )
-        else:
-            ds = self.data.interp(coords=dict(x=x, y=y), method=method)  # type: ignore
+    def _point_result_from_ds(self, ds: xr.Dataset, obs_name: str) -> PointModelResult:
+        """Build a PointModelResult from an already spatially extracted dataset"""
+        # build the 1-column (plus aux) frame directly from the numpy arrays;
+        # to_dataframe() would pay for MultiIndex construction per call
+        cols = {self.name: ds[self.sel_items.values].values}
+        for aux in self.sel_items.aux:
+            cols[aux] = ds[aux].values
+        df = pd.DataFrame(cols, index=pd.DatetimeIndex(ds.time.values, name="time"))
         # TODO: exclude aux cols in dropna
-        df = ds.to_dataframe().drop(columns=["x", "y"]).dropna()
+        df = _dropna_if_needed(df)
         if len(df) == 0:
             raise ValueError(
-                f"Spatial point extraction failed for PointObservation '{observation.name}' in GridModelResult '{self.name}'! (is point outside model domain? Consider spatial_method='nearest')"
+                f"Spatial point extraction failed for PointObservation '{obs_name}' in GridModelResult '{self.name}'! (is point outside model domain? Consider spatial_method='nearest')"
             )
-        df = df.rename(columns={self.sel_items.values: self.name})
 
         return PointModelResult(
             data=df,
@@ -192,6 +277,132 @@ class GridModelResult(SpatialField):
             aux_items=self.sel_items.aux,
         )
 
+    def _extract_point(
+        self, observation: PointObservation, spatial_method: Optional[str] = None
+    ) -> PointModelResult:
+        """Spatially extract a PointModelResult from a GridModelResult (when data is a xarray.Dataset),
+        given a PointObservation. No time interpolation is done!"""
+        method: str = spatial_method or "linear"
+
+        self._validate_point_position(observation)
+        x, y, z = observation.x, observation.y, observation.z
+
+        assert isinstance(self.data, xr.Dataset)
+
+        # TODO: avoid runtrip to pandas if possible (potential loss of metadata)
+        coords = (
+            dict(x=x, y=y, z=z)
+            if "z" in self.data.dims and z is not None
+            else dict(x=x, y=y)
+        )
+        if method == "nearest":
+            if "z" not in coords and self._x_axis and self._y_axis:
+                # uniform spacing: nearest index is a single FP op,
+                # no searchsorted needed
+                ds = self.data.isel(
+                    x=self._nearest_index(x, *self._x_axis),
+                    y=self._nearest_index(y, *self._y_axis),
+                )
+            else:
+                # index-based lookup; interp would set up a scipy
+                # interpolator even for nearest-neighbor selection
+                ds = self.data.sel(coords, method="nearest")
+        else:
+            ds = self.data.interp(coords=coords, method=method)  # type: ignore
+
+        return self._point_result_from_ds(ds, observation.name)
+
+    def _has_simple_grid(self, ds: xr.Dataset) -> bool:
+        """Rectilinear in-memory grid with ascending 1D time/x/y coords?"""
+        for c in ("time", "x", "y"):
+            if c not in ds.coords or ds[c].ndim != 1 or len(ds[c]) < 2:
+                return False
+        for v in self.sel_items.all:
+            da = ds[v]
+            if set(da.dims) != {"time", "y", "x"} or not isinstance(
+                da.data, np.ndarray
+            ):
+                return False
+        return bool(
+            np.all(np.diff(ds.x.values) > 0)
+            and np.all(np.diff(ds.y.values) > 0)
+            and np.all(np.diff(ds.time.values) > np.timedelta64(0))
+        )
+
+    @staticmethod
+    def _bracket(grid: np.ndarray, q: np.ndarray) -> tuple:
+        """Left cell index, fractional weight and out-of-range mask"""
+        i = np.clip(np.searchsorted(grid, q, side="right") - 1, 0, grid.size - 2)
+        w = (q - grid[i]) / (grid[i + 1] - grid[i])
+        outside = (q < grid[0]) | (q > grid[-1])
+        return i, w, outside
+
+    def _localize_track(self, track_df: pd.DataFrame) -> xr.Dataset:
+        """Subset the grid to the track bounding box (plus one cell of
+        padding on each side) before interpolation; interp cost scales
+        with the bytes touched, not with the track length."""
+        ds = self.data
+        indexers = {}
+        queries = {
+            "time": track_df.index.values,
+            "x": track_df.x.values,
+            "y": track_df.y.values,
+        }
+        for dim in queries:
+            vals = ds[dim].values
+            if vals.ndim == 1 and len(vals) > 1 and vals[0] > vals[-1]:
+                # normalize descending coords (e.g. latitude) so the
+                # subset can be interpolated with assume_sorted=True
+                ds = ds.isel({dim: slice(None, None, -1)})
+        for dim, q in queries.items():
+            vals = ds[dim].values
+            if vals.ndim != 1 or len(vals) < 2:
+                continue
+            i0 = max(np.searchsorted(vals, q.min(), side="left") - 1, 0)
+            i1 = min(np.searchsorted(vals, q.max(), side="right") + 1, len(vals))
+            indexers[dim] = slice(i0, i1)
+        return ds.isel(indexers)
+
+    def _interp_track_linear(self, ds: xr.Dataset, track_df: pd.DataFrame) -> pd.DataFrame:
+        """Trilinear (time, y, x) interpolation of all items to track positions"""
+        gt = ds.time.values.astype("M8[ns]").view("i8")
+        tq = track_df.index.values.astype("M8[ns]").view("i8")
+        xq = track_df.x.values.astype(float)
+        yq = track_df.y.values.astype(float)
+
+        it, wt, out_t = self._bracket(gt, tq)
+        iy, wy, out_y = self._bracket(ds.y.values.astype(float), yq)
+        ix, wx, out_x = self._bracket(ds.x.values.astype(float), xq)
+        outside = out_t | out_y | out_x
+
+        # corner weights and flat gather indices are shared by all items;
+        # compute them once and accumulate through a single scratch buffer
+        ny = ds.sizes["y"]
+        nx = ds.sizes["x"]
+        corners = [
+            ((it + dt) * (ny * nx) + (iy + dy) * nx + (ix + dx), cwt * cwy * cwx)
+            for dt, cwt in ((0, 1 - wt), (1, wt))
+            for dy, cwy in ((0, 1 - wy), (1, wy))
+            for dx, cwx in ((0, 1 - wx), (1, wx))
+        ]
+
+        cols: dict = {"x": xq, "y": yq}
+        scratch = np.empty(len(xq))
+        for v in self.sel_items.all:
+            flat = np.ascontiguousarray(
+                ds[v].transpose("time", "y", "x").values, dtype=np.float64
+            ).reshape(-1)
+            val = np.zeros(len(xq))
+            for idx, w in corners:
+                np.take(flat, idx, out=scratch)
+                scratch *= w
+                val += scratch
+            val[outside] = np.nan
+            name = self.name if v == self.sel_items.values else v
+            cols[name] = val
+
+        return pd.DataFrame(cols, index=track_df.index)
+
     def _extract_track(
         self, observation: TrackObservation, spatial_method: Optional[str] = None
     ) -> TrackModelResult:
@@ -202,20 +413,34 @@ class GridModelResult(SpatialField):
         obs_df = observation.data.to_dataframe()
 
         renamed_obs_data = rename_coords_pd(obs_df)
-        t = xr.DataArray(renamed_obs_data.index, dims="track")
-        x = xr.DataArray(renamed_obs_data.x, dims="track")
-        y = xr.DataArray(renamed_obs_data.y, dims="track")
 
         assert isinstance(self.data, xr.Dataset)
-        ds = self.data.interp(
-            coords=dict(time=t, x=x, y=y),
-            method=method,  # type: ignore
-        )
-        df = ds.to_dataframe().drop(columns=["time"])
-        df = df.rename(columns={self.sel_items.values: self.name})
+        sub = self._localize_track(renamed_obs_data)
+        if method == "linear" and self._has_simple_grid(sub):
+            # vectorized searchsorted + trilinear weights; avoids xarray's
+            # per-point scipy interpolation setup on large tracks
+            df = self._interp_track_linear(sub, renamed_obs_data)
+        else:
+            t = xr.DataArray(renamed_obs_data.index, dims="track")
+            x = xr.DataArray(renamed_obs_data.x, dims="track")
+            y = xr.DataArray(renamed_obs_data.y, dims="track")
+
+            ds = sub.interp(
+                coords=dict(time=t, x=x, y=y),
+                method=method,  # type: ignore
+                assume_sorted=True,
+            )
+            # build the frame directly from the numpy arrays; to_dataframe()
+            # would materialize the time coord as a column just to drop it
+            cols = {self.name: ds[self.sel_items.values].values}
+            for aux in self.sel_items.aux:
+                cols[aux] = ds[aux].values
+            cols["x"] = ds.x.values
+            cols["y"] = ds.y.values
+            df = pd.DataFrame(cols, index=renamed_obs_data.index)
 
         return TrackModelResult(
-            data=df.dropna(),  # TODO: exclude aux cols in dropna
+            data=_dropna_if_needed(df),  # TODO: exclude aux cols in dropna
             item=self.name,
             x_item="x",
             y_item="y",
@@ -9,6 +9,7 @@ from ..obs import Observation, PointObservation
 from ..types import PointType
 from ..quantity import Quantity
 from ..timeseries import TimeSeries, _parse_point_input
+from ..utils import _asi8_ns
 from ._base import Alignable
 
 
@@ -111,15 +112,70 @@ class PointModelResult(TimeSeries, Alignable):
     ) -> xr.Dataset:
         new_time = observation.time
 
-        dati = self.data.dropna("time").interp(
-            time=new_time, assume_sorted=True, **kwargs
-        )
+        if not kwargs and self._is_aligned_with(observation):
+            # model is already on the observation time axis; interpolation
+            # (and gap removal: all bracketing gaps are zero) is an identity
+            return self.data
+
+        if kwargs:
+            dati = self.data.dropna("time").interp(
+                time=new_time, assume_sorted=True, **kwargs
+            )
+        else:
+            # fast numpy path equivalent to xr.interp(method="linear")
+            dati = self._interp_time_linear(
+                new_time, new_time_i8=getattr(observation, "_time_i8", None)
+            )
 
         pmr = PointModelResult(dati)
         if max_gap is not None:
             pmr = pmr._remove_model_gaps(mod_index=self.time, max_gap=max_gap)
         return pmr.data
 
+    def _is_aligned_with(self, observation: Observation) -> bool:
+        """Same time axis and no NaNs (which interpolation would bridge)?"""
+        obs_i8 = getattr(observation, "_time_i8", None)
+        if obs_i8 is None or self.data.sizes["time"] != len(obs_i8):
+            return False
+        if not np.array_equal(self._time_i8, obs_i8):
+            return False
+        return not any(
+            np.isnan(self.data[v].values).any() for v in self.data.data_vars
+        )
+
+    def _interp_time_linear(
+        self, new_time: pd.DatetimeIndex, new_time_i8: Optional[np.ndarray] = None
+    ) -> xr.Dataset:
+        """Linear-in-time interpolation of all data variables to new_time
+
+        Equivalent to dropna('time').interp(time=new_time) but with a
+        single np.interp C loop per variable instead of the xarray/pandas
+        dispatch machinery. The int64 view of new_time can be passed to
+        avoid re-converting an observation time axis per model result.
+        """
+        ds = self.data
+        if any(np.isnan(ds[v].values).any() for v in ds.data_vars):
+            ds = ds.dropna("time")
+        xp = _asi8_ns(ds.time.to_index())
+        xi = _asi8_ns(new_time) if new_time_i8 is None else new_time_i8
+
+        outside = (
+            (xi < xp[0]) | (xi > xp[-1]) if xp.size > 0 else np.full(xi.shape, True)
+        )
+        data_vars = {}
+        for v in ds.data_vars:
+            yi = (
+                np.interp(xi, xp, ds[v].values.astype(float))
+                if xp.size > 0
+                else np.full(xi.shape, np.nan)
+            )
+            yi[outside] = np.nan
+            data_vars[v] = xr.DataArray(yi, dims="time", attrs=ds[v].attrs)
+
+        coords = {k: c for k, c in ds.coords.items() if "time" not in c.dims}
+        coords["time"] = new_time
+        return xr.Dataset(data_vars, coords=coords, attrs=ds.attrs)
+
     def _remove_model_gaps(
         self,
         mod_index: pd.DatetimeIndex,
@@ -136,27 +192,23 @@ class PointModelResult(TimeSeries, Alignable):
     ) -> pd.DatetimeIndex:
         """Used only by _remove_model_gaps"""
         obs_index = self.time
-        # init dataframe of available timesteps and their index
-        df = pd.DataFrame(index=mod_index)
-        df["idx"] = range(len(df))
-
-        # for query times get available left and right index of source times
-        df = (
-            df.reindex(df.index.union(obs_index))
-            .interpolate(method="time", limit_area="inside")
-            .reindex(obs_index)
-            .dropna()
-        )
-        df["idxa"] = np.floor(df.idx).astype(int)
-        df["idxb"] = np.ceil(df.idx).astype(int)
-
-        # time of left and right source times and time delta
-        df["ta"] = mod_index[df.idxa]
-        df["tb"] = mod_index[df.idxb]
-        df["dt"] = df.tb - df.ta
-
-        # valid query times where time delta is less than max_gap
-        valid_idx = df.dt <= max_gap
-        return df[valid_idx].index
+        m = _asi8_ns(mod_index)
+        o = _asi8_ns(obs_index)
+
+        # only query times inside the model period can be validated
+        inside = (o >= m[0]) & (o <= m[-1])
+
+        # left and right model neighbor of each query time
+        oi = o[inside]
+        right = np.searchsorted(m, oi, side="left")
+        left = np.searchsorted(m, oi, side="right")
+        np.subtract(left, 1, out=left)
+        np.maximum(left, 0, out=left)
+
+        # valid query times are those bracketed by a gap less than max_gap
+        # (in-place ops keep this a single temporary buffer)
+        gap = m[right]
+        np.subtract(gap, m[left], out=gap)
+        return obs_index[inside][gap <= max_gap.value]
 
 
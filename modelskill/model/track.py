@@ -85,19 +85,29 @@ class TrackModelResult(TimeSeries, Alignable):
         spatial_tolerance = 1e-3
 
         mri = self
-        mod_df = mri.data.to_dataframe()
-        obs_df = observation.data.to_dataframe()
 
-        # 1. inner join on time
-        df = mod_df.join(obs_df, how="inner", lsuffix="_mod", rsuffix="_obs")
+        # 1. intersect on time (sorted int64 axes, no dataframe round-trip)
+        tm = mri.data.time.values.astype("M8[ns]").view("i8")
+        to = observation.data.time.values.astype("M8[ns]").view("i8")
+        if tm.size == to.size and np.array_equal(tm, to):
+            # common case: model track was extracted at the obs positions
+            im = io = np.arange(tm.size)
+        else:
+            _, im, io = np.intersect1d(tm, to, return_indices=True)
 
         # 2. remove model points outside observation track
-        n_points = len(df)
-        keep_x = np.abs((df.x_mod - df.x_obs)) < spatial_tolerance
-        keep_y = np.abs((df.y_mod - df.y_obs)) < spatial_tolerance
-        df = df[keep_x & keep_y]
-        if n_points_removed := n_points - len(df):
+        # (in-place ops avoid intermediate |dx|/|dy| buffers)
+        n_points = len(im)
+        dx = mri.data.x.values[im]
+        np.subtract(dx, observation.data.x.values[io], out=dx)
+        np.abs(dx, out=dx)
+        dy = mri.data.y.values[im]
+        np.subtract(dy, observation.data.y.values[io], out=dy)
+        np.abs(dy, out=dy)
+        keep = dx < spatial_tolerance
+        keep &= dy < spatial_tolerance
+        if n_points_removed := n_points - int(keep.sum()):
             warnings.warn(
                 f"Removed {n_points_removed} model points outside observation track (spatial_tolerance={spatial_tolerance})"
             )
-        return mri.data.sel(time=df.index)
+        return mri.data.isel(time=im[keep])
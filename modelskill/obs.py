@@ -9,12 +9,18 @@ Examples
 
 from __future__ import annotations
 
-from typing import Literal, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
+from pathlib import Path
+import pickle
+from typing import Literal, Optional, Any, Sequence, Union
 import warnings
 import pandas as pd
 import xarray as xr
 
 from .types import PointType, TrackType, GeometryType, DataInputType
+from .utils import _round_100us
 from . import Quantity
 from .timeseries import (
     TimeSeries,
@@ -94,6 +100,36 @@ def _validate_attrs(data_attrs: dict, attrs: Optional[dict]) -> None:
             )
 
 
+def _observation_cache_file(data: Any, key_parts: tuple) -> Optional[Path]:
+    """Cache-file path for a file-based observation, or None
+
+    The key includes path, mtime and size, so edited or replaced files
+    invalidate their cache entries automatically.
+    """
+    if not isinstance(data, (str, Path)) or not Path(data).exists():
+        return None
+    path = Path(data).resolve()
+    st = path.stat()
+    key = repr((str(path), st.st_mtime_ns, st.st_size, *key_parts))
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    cache_dir = (
+        Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "modelskill"
+    )
+    return cache_dir / f"{digest}.pkl"
+
+
+def _parse_with_cache(data: Any, cache: bool, key_parts: tuple, parse) -> xr.Dataset:
+    """Parse observation input, optionally through the on-disk cache"""
+    cache_file = _observation_cache_file(data, key_parts) if cache else None
+    if cache_file is not None and cache_file.exists():
+        return pickle.loads(cache_file.read_bytes())
+    ds = parse()
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(ds))
+    return ds
+
+
 class Observation(TimeSeries):
     def __init__(
         self,
@@ -139,7 +175,7 @@ class Observation(TimeSeries):
     @staticmethod
     def _parse_time(time):
         if isinstance(time, pd.DatetimeIndex):
-            return time.dt.round("100us")
+            return _round_100us(time)
         else:
             return time  # can be RangeIndex
 
@@ -173,6 +209,9 @@ class PointObservation(Observation):
         additional attributes to be added to the data, by default None
     weight : float, optional
         weighting factor for skill scores, by default 1.0
+    cache : bool, optional
+        cache the parsed data on disk for faster repeated loads of the
+        same file, by default False
 
     Examples
     --------
@@ -196,17 +235,23 @@ class PointObservation(Observation):
         quantity: Optional[Quantity] = None,
         aux_items: Optional[list[int | str]] = None,
         attrs: Optional[dict] = None,
+        cache: bool = False,
     ) -> None:
         if not self._is_input_validated(data):
-            data = _parse_point_input(
+            data = _parse_with_cache(
                 data,
-                name=name,
-                item=item,
-                quantity=quantity,
-                aux_items=aux_items,
-                x=x,
-                y=y,
-                z=z,
+                cache=cache,
+                key_parts=(item, name, x, y, z, str(quantity), repr(aux_items)),
+                parse=lambda: _parse_point_input(
+                    data,
+                    name=name,
+                    item=item,
+                    quantity=quantity,
+                    aux_items=aux_items,
+                    x=x,
+                    y=y,
+                    z=z,
+                ),
             )
 
         assert isinstance(data, xr.Dataset)
@@ -256,6 +301,13 @@ class TrackObservation(Observation):
         additional attributes to be added to the data, by default None
     weight : float, optional
         weighting factor for skill scores, by default 1.0
+    cache : bool, optional
+        cache the parsed data on disk for faster repeated loads of the
+        same file, by default False
+    coord_dtype : data-type, optional
+        downcast x- and y-coordinates to this dtype (e.g. np.float32)
+        to halve their memory footprint for large tracks,
+        by default keep the input dtype
 
     Examples
     --------
@@ -316,6 +368,8 @@ class TrackObservation(Observation):
         quantity: Optional[Quantity] = None,
         aux_items: Optional[list[int | str]] = None,
         attrs: Optional[dict] = None,
+        cache: bool = False,
+        coord_dtype: Optional[Any] = None,
     ) -> None:
         if not self._is_input_validated(data):
             if offset_duplicates != 0.001:
@@ -323,20 +377,70 @@ class TrackObservation(Observation):
                     "The 'offset_duplicates' argument is deprecated, use 'keep_duplicates' argument.",
                     FutureWarning,
                 )
-            data = _parse_track_input(
-                data=data,
-                name=name,
-                item=item,
-                quantity=quantity,
-                x_item=x_item,
-                y_item=y_item,
-                keep_duplicates=keep_duplicates,
-                offset_duplicates=offset_duplicates,
-                aux_items=aux_items,
+            data = _parse_with_cache(
+                data,
+                cache=cache,
+                key_parts=(
+                    item,
+                    name,
+                    x_item,
+                    y_item,
+                    keep_duplicates,
+                    offset_duplicates,
+                    str(quantity),
+                    repr(aux_items),
+                ),
+                parse=lambda: _parse_track_input(
+                    data=data,
+                    name=name,
+                    item=item,
+                    quantity=quantity,
+                    x_item=x_item,
+                    y_item=y_item,
+                    keep_duplicates=keep_duplicates,
+                    offset_duplicates=offset_duplicates,
+                    aux_items=aux_items,
+                ),
             )
+            if coord_dtype is not None:
+                data = data.assign_coords(
+                    x=data.x.astype(coord_dtype), y=data.y.astype(coord_dtype)
+                )
         assert isinstance(data, xr.Dataset)
         super().__init__(data=data, weight=weight, attrs=attrs)
 
+    @classmethod
+    def from_files(
+        cls,
+        paths: Sequence[Union[str, Path]],
+        *,
+        n_workers: int = 2,
+        **kwargs: Any,
+    ) -> list["TrackObservation"]:
+        """Construct TrackObservations from multiple files
+
+        File reads and parsing of different files overlap in a small
+        thread pool, so the wall time for a batch approaches
+        max(IO time, CPU time) instead of their sum.
+
+        Parameters
+        ----------
+        paths : Sequence[str | Path]
+            paths to dfs0 files, one observation per file
+        n_workers : int, optional
+            number of worker threads, by default 2
+        **kwargs
+            additional keyword arguments passed to TrackObservation,
+            e.g. item, x_item, y_item (name is taken from each file)
+
+        Returns
+        -------
+        list[TrackObservation]
+            observations in the same order as paths
+        """
+        with ThreadPoolExecutor(max_workers=max(1, n_workers)) as executor:
+            return list(executor.map(lambda p: cls(p, **kwargs), paths))
+
 
 def unit_display_name(name: str) -> str:
     """Display name
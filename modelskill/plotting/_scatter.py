@@ -170,21 +170,40 @@ def scatter(
             )
 
         # calculate density data
-        z = __scatter_density(x_sample, y_sample, binsize=binsize)
-        idx = z.argsort()
+        z = __scatter_density(
+            x_sample, y_sample, binsize=binsize, xymin=xymin, xymax=xymax
+        )
+        # draw order only needs a coarse density ranking; a stable
+        # radix sort of 64 quantized levels is O(N) vs a full
+        # float argsort
+        zmax = z.max()
+        if zmax > 0:
+            idx = np.argsort((z * (63.0 / zmax)).astype(np.uint8), kind="stable")
+        else:
+            idx = np.arange(len(z))
         # Sort data by colormaps
         x_sample, y_sample, z = x_sample[idx], y_sample[idx], z[idx]
         # scale Z by sample size
         z = z * len(x) / len(x_sample)
 
-    PLOTTING_BACKENDS: dict[str, Callable] = {
-        "matplotlib": _scatter_matplotlib,
-        "plotly": _scatter_plotly,
-    }
+        # freeze the normalization so matplotlib does not rescale the
+        # colors on every draw (pan/zoom)
+        if norm.vmax is None:
+            norm.vmax = float(z.max())
 
     if backend not in PLOTTING_BACKENDS:
         raise ValueError(f"backend must be one of {list(PLOTTING_BACKENDS.keys())}")
 
+    # fit the regression line once here instead of in each backend
+    slope, intercept = None, None
+    if reg_method:
+        if fit_to_quantiles:
+            slope, intercept = _linear_regression(
+                obs=xq, model=yq, reg_method=reg_method
+            )
+        else:
+            slope, intercept = _linear_regression(obs=x, model=y, reg_method=reg_method)
+
     if skill_table:
         from modelskill import from_matched
 
@@ -212,7 +231,8 @@ def scatter(
         show_points=show_points,
         show_hist=show_hist,
         nbins_hist=nbins_hist,
-        reg_method=reg_method,
+        slope=slope,
+        intercept=intercept,
         xlabel=xlabel,
         ylabel=ylabel,
         figsize=figsize,
@@ -242,7 +262,8 @@ def _scatter_matplotlib(
     show_hist,
     norm,
     nbins_hist,
-    reg_method,
+    slope,
+    intercept,
     xlabel,
     ylabel,
     figsize,
@@ -301,14 +322,7 @@ def _scatter_matplotlib(
             **settings.get_option("plot.scatter.quantiles.kwargs"),
         )
 
-    if reg_method:
-        if fit_to_quantiles:
-            slope, intercept = _linear_regression(
-                obs=xq, model=yq, reg_method=reg_method
-            )
-        else:
-            slope, intercept = _linear_regression(obs=x, model=y, reg_method=reg_method)
-
+    if slope is not None:
         ax.plot(
             x_trend,
             intercept + slope * x_trend,
@@ -320,11 +334,18 @@ def _scatter_matplotlib(
         )
 
     if show_hist:
-        ax.hist2d(
-            x,
-            y,
-            bins=nbins_hist,
-            cmin=0.01,
+        # rasterize the precomputed grid with imshow; hist2d draws a
+        # pcolormesh of nbins^2 individual quads which is much slower
+        counts, xedges, yedges = _fast_hist2d(x, y, nbins_hist)
+        if norm.vmax is None:
+            # freeze the normalization (see the density branch in scatter)
+            norm.vmax = float(counts.max())
+        ax.imshow(
+            np.ma.masked_less(counts.T, 0.01),
+            extent=(xedges[0], xedges[-1], yedges[0], yedges[-1]),
+            origin="lower",
+            interpolation="nearest",
+            aspect="auto",
             zorder=0.5,
             norm=norm,
             alpha=options.plot.scatter.points.alpha,
@@ -380,7 +401,8 @@ def _scatter_plotly(
     norm,  # TODO not used by plotly, remove or keep for consistency?
     show_hist,
     nbins_hist,
-    reg_method,
+    slope,
+    intercept,
     xlabel,
     ylabel,
     figsize,  # TODO not used by plotly, remove or keep for consistency?
@@ -403,14 +425,7 @@ def _scatter_plotly(
         go.Scatter(x=xlim, y=xlim, name="1:1", mode="lines", line=dict(color="blue")),
     ]
 
-    if reg_method:
-        if fit_to_quantiles:
-            slope, intercept = _linear_regression(
-                obs=xq, model=yq, reg_method=reg_method
-            )
-        else:
-            slope, intercept = _linear_regression(obs=x, model=y, reg_method=reg_method)
-
+    if slope is not None:
         regression_line = go.Scatter(
             x=x_trend,
             y=intercept + slope * x_trend,
@@ -511,6 +526,12 @@ def _scatter_plotly(
     fig.show()  # Should this be here
 
 
+PLOTTING_BACKENDS: dict[str, Callable] = {
+    "matplotlib": _scatter_matplotlib,
+    "plotly": _scatter_plotly,
+}
+
+
 def _reglabel(slope: float, intercept: float, fit_to_quantiles: bool) -> str:
     sign = "" if intercept < 0 else "+"
     if fit_to_quantiles:
@@ -529,7 +550,7 @@ def _get_bins(bins: int | float, xymin, xymax) -> Tuple[int, float]:
         binsize: float = xyspan / nbins_hist
     elif isinstance(bins, float):
         binsize = bins
-        nbins_hist = xyspan // binsize
+        nbins_hist = int(xyspan // binsize)
     else:
         raise TypeError("bins must be a number")
 
@@ -538,6 +559,24 @@ def _get_bins(bins: int | float, xymin, xymax) -> Tuple[int, float]:
     return nbins_hist, binsize
 
 
+def _fast_hist2d(x, y, nb: int):
+    """Uniform-bin 2D histogram in one bincount pass
+
+    Equivalent to np.histogram2d(x, y, bins=nb) but bins both axes with
+    integer index arithmetic instead of per-axis searchsorted.
+    """
+    x0, x1 = x.min(), x.max()
+    y0, y1 = y.min(), y.max()
+    ix = ((x - x0) * (nb / (x1 - x0))).astype(np.intp)
+    np.clip(ix, 0, nb - 1, out=ix)
+    iy = ((y - y0) * (nb / (y1 - y0))).astype(np.intp)
+    np.clip(iy, 0, nb - 1, out=iy)
+    counts = np.bincount(ix * nb + iy, minlength=nb * nb).reshape(nb, nb)
+    xedges = np.linspace(x0, x1, nb + 1)
+    yedges = np.linspace(y0, y1, nb + 1)
+    return counts, xedges, yedges
+
+
 def _plot_summary_border(
     figure_transform,
     x0,
@@ -595,6 +634,7 @@ def _plot_summary_table(
 
     fig = plt.gcf()
     figure_transform = fig.transFigure.get_affine()
+    inverted_transform = figure_transform.inverted()
 
     # General text settings
     txt_settings = dict(
@@ -610,7 +650,7 @@ def _plot_summary_table(
         # plt.draw() # TOOO this causes an error and I have no idea why it is here
         dx = (
             dx
-            + figure_transform.inverted().transform(
+            + inverted_transform.transform(
                 [text_col_i.get_window_extent().bounds[2], 0]
             )[0]
         )
@@ -618,17 +658,16 @@ def _plot_summary_table(
 
     # Plot border
     ## Define coordintes
-    x0, y0 = figure_transform.inverted().transform(
-        text_columns[0].get_window_extent().bounds[0:2]
-    )
-    _, dy = figure_transform.inverted().transform(
-        (0, text_columns[0].get_window_extent().bounds[3])
-    )
+    bounds0 = text_columns[0].get_window_extent().bounds
+    x0, y0 = inverted_transform.transform(bounds0[0:2])
+    _, dy = inverted_transform.transform((0, bounds0[3]))
 
     _plot_summary_border(figure_transform, x0, y0, dx, dy)
 
 
-def __scatter_density(x, y, binsize: float = 0.1, method: str = "linear"):
+def __scatter_density(
+    x, y, binsize: float = 0.1, method: str = "linear", xymin=None, xymax=None
+):
     """Interpolates scatter data on a 2D histogram (gridded) based on data density.
 
     Parameters
@@ -640,7 +679,11 @@ def __scatter_density(x, y, binsize: float = 0.1, method: str = "linear"):
     binsize: float, optional
         2D histogram (bin) resolution, by default = 0.1
     method: str, optional
-        Scipy griddata interpolation method, by default 'linear'
+        Scipy grid interpolation method, by default 'linear'
+    xymin: float, optional
+        lower bound of the data range, computed from x and y if not given
+    xymax: float, optional
+        upper bound of the data range, computed from x and y if not given
 
     Returns
     ----------
@@ -648,15 +691,15 @@ def __scatter_density(x, y, binsize: float = 0.1, method: str = "linear"):
         Array with the colors based on histogram density
     """
 
-    hist, cxy = __hist2d(x, y, binsize)
-
-    # Grid-data
-    xg, yg = np.meshgrid(cxy, cxy)
-    xg = xg.ravel()
-    yg = yg.ravel()
+    histodata, cxy = __hist2d(x, y, binsize, xymin=xymin, xymax=xymax)
 
     ## Interpolate histogram density data to scatter data
-    Z_grid = interpolate.griddata((xg, yg), hist, (x, y), method=method)
+    # the histogram lives on a regular grid, so a direct grid
+    # interpolation is O(N) - no Delaunay triangulation needed
+    interp = interpolate.RegularGridInterpolator(
+        (cxy, cxy), histodata, method=method, bounds_error=False, fill_value=0.0
+    )
+    Z_grid = interp(np.column_stack((x, y)))
 
     # Replace negative values (should there be some) in case of 'cubic' interpolation
     Z_grid[(Z_grid < 0)] = 0
@@ -664,7 +707,7 @@ def __scatter_density(x, y, binsize: float = 0.1, method: str = "linear"):
     return Z_grid
 
 
-def __hist2d(x, y, binsize):
+def __hist2d(x, y, binsize, xymin=None, xymax=None):
     """Calculates 2D histogram (gridded) of data.
 
     Parameters
@@ -675,6 +718,10 @@ def __hist2d(x, y, binsize):
         Y values e.g observation values, must be same length as x
     binsize: float, optional
         2D histogram (bin) resolution, by default = 0.1
+    xymin: float, optional
+        lower bound of the data range, computed from x and y if not given
+    xymax: float, optional
+        upper bound of the data range, computed from x and y if not given
 
     Returns
     ----------
@@ -682,28 +729,23 @@ def __hist2d(x, y, binsize):
         2D-histogram data
     cxy: np.array
         Center points of the histogram bins
-    exy: np.array
-        Edges of the histogram bins
     """
-    # Make linear-grid for interpolation
-    minxy = min(min(x), min(y)) - binsize
-    maxxy = max(max(x), max(y)) + binsize
+    # Make linear-grid for interpolation; the caller usually already
+    # knows the data range, saving four full passes over the arrays
+    if xymin is None:
+        xymin = min(x.min(), y.min())
+    if xymax is None:
+        xymax = max(x.max(), y.max())
+    minxy = xymin - binsize
+    maxxy = xymax + binsize
     # Center points of the bins
     cxy = np.arange(minxy, maxxy, binsize)
-    # Edges of the bins
-    exy = np.arange(minxy - binsize * 0.5, maxxy + binsize * 0.5, binsize)
-    if exy[-1] <= cxy[-1]:
-        # sometimes, given the bin size, the edges array ended before (left side) of the bins-center array
-        # in such case, and extra half-bin is added at the end
-        exy = np.arange(minxy - binsize * 0.5, maxxy + binsize, binsize)
+    # Edges of the bins, derived from the centers so the counts always
+    # line up with them (a second float-step arange can drift off by
+    # one bin)
+    exy = np.append(cxy - binsize * 0.5, cxy[-1] + binsize * 0.5)
 
     # Calculate 2D histogram
     histodata, _, _ = np.histogram2d(x, y, [exy, exy])
 
-    # Histogram values
-    hist = []
-    for j in range(len(cxy)):
-        for i in range(len(cxy)):
-            hist.append(histodata[i, j])
-
-    return hist, cxy
+    return histodata, cxy
@@ -10,9 +10,12 @@ import mikeio
 
 from ..types import GeometryType, PointType
 from ..quantity import Quantity
-from ..utils import _get_name
+from ..utils import _ensure_datetime_index, _get_name, _get_names
 from ._timeseries import _validate_data_var_name
 
+# isinstance-ready tuple; get_args allocates a fresh tuple on every call
+_POINT_TYPES = get_args(PointType)
+
 
 @dataclass
 class PointItem:
@@ -41,7 +44,7 @@ def _parse_point_items(
     item = _get_name(item, valid_names=items)
     if isinstance(aux_items, (str, int)):
         aux_items = [aux_items]
-    aux_items_str = [_get_name(i, valid_names=items) for i in aux_items or []]
+    aux_items_str = _get_names(aux_items or [], valid_names=items)
 
     # check that there are no duplicates
     res = PointItem(values=item, aux=aux_items_str)
@@ -63,18 +66,24 @@ def _parse_point_input(
 ) -> xr.Dataset:
     """Convert accepted input data to an xr.Dataset"""
     assert isinstance(
-        data, get_args(PointType)
+        data, _POINT_TYPES
     ), f"Could not construct object from provided data of type {type(data)}"
 
     if isinstance(data, (str, Path)):
         suffix = Path(data).suffix
         name = name or Path(data).stem
         if suffix == ".dfs0":
-            data = mikeio.read(data)  # now mikeio.Dataset
+            data = mikeio.open(data)  # resolve items below, then read
         elif suffix == ".nc":
             data = xr.open_dataset(data)
-    elif isinstance(data, mikeio.Dfs0):
-        data = data.read()  # now mikeio.Dataset
+    if isinstance(data, mikeio.Dfs0):
+        # resolve items against the file header and read only those;
+        # mikeio.read would load every column into memory first
+        sel = _parse_point_items(
+            [i.name for i in data.items], item=item, aux_items=aux_items
+        )
+        data = data.read(items=sel.all)  # now mikeio.Dataset
+        item, aux_items = sel.values, sel.aux
 
     # parse items
     if isinstance(data, (mikeio.DataArray, pd.Series, xr.DataArray)):
@@ -122,6 +131,7 @@ def _parse_point_input(
     if isinstance(data, mikeio.Dataset):
         ds = data.to_xarray()
     elif isinstance(data, pd.DataFrame):
+        data = _ensure_datetime_index(data)
         data.index.name = "time"
         ds = data.to_xarray()
     else:
@@ -136,15 +146,39 @@ def _parse_point_input(
     name = name or item_name
     name = _validate_data_var_name(name)
 
-    n_unique_times = len(ds.time.to_index().unique())
-    if n_unique_times < len(ds.time):
-        raise ValueError("time must be unique (please check for duplicate times))")
-
-    if not ds.time.to_index().is_monotonic_increasing:
-        raise ValueError("time must be increasing (please check for duplicate times))")
+    tvals = ds.time.values
+    if tvals.dtype.kind == "M":
+        # one int64 diff pass covers both checks; no pandas index needed
+        steps = np.diff(tvals.astype("M8[ns]").view("i8"))
+        if (steps == 0).any():
+            raise ValueError(
+                "time must be unique (please check for duplicate times))"
+            )
+        if (steps < 0).any():
+            raise ValueError(
+                "time must be increasing (please check for duplicate times))"
+            )
+    else:
+        time_idx = ds.time.to_index()
+        if not time_idx.is_unique:
+            raise ValueError(
+                "time must be unique (please check for duplicate times))"
+            )
+        if not time_idx.is_monotonic_increasing:
+            raise ValueError(
+                "time must be increasing (please check for duplicate times))"
+            )
 
-    # basic processing
-    ds = ds.dropna(dim="time")
+    # basic processing: one fused NaN mask over all variables; the
+    # gather (and the mask reduction itself) is skipped for dense data
+    if all(da.dtype.kind == "f" for da in ds.data_vars.values()):
+        nan_row = np.zeros(ds.sizes["time"], dtype=bool)
+        for da in ds.data_vars.values():
+            nan_row |= np.isnan(da.values)
+        if nan_row.any():
+            ds = ds.isel(time=np.flatnonzero(~nan_row))
+    else:
+        ds = ds.dropna(dim="time")
 
     vars = [v for v in ds.data_vars]
     assert len(ds.data_vars) == 1 + len(sel_items.aux)
@@ -1,5 +1,4 @@
 from __future__ import annotations
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import ClassVar, Optional, TypeVar, Any
 import numpy as np
@@ -8,6 +7,7 @@ import xarray as xr
 
 from ..types import GeometryType
 from ..quantity import Quantity
+from ..utils import _asi8_ns, _round_100us
 from ._plotter import TimeSeriesPlotter, MatplotlibTimeSeriesPlotter
 from .. import __version__
 
@@ -54,7 +54,10 @@ def _validate_dataset(ds: xr.Dataset) -> xr.Dataset:
     assert len(ds.dims) == 1, "Only 0-dimensional data are supported"
     assert list(ds.dims)[0] == "time", "data must have a time dimension"
     assert isinstance(ds.time.to_index(), pd.DatetimeIndex), "time must be datetime"
-    ds["time"] = pd.DatetimeIndex(ds.time.to_index()).round(freq="100us")  # 0.0001s
+    idx = pd.DatetimeIndex(ds.time.to_index())
+    rounded = _round_100us(idx)  # 0.0001s
+    if rounded is not idx:  # only rewrite the coord if rounding changed it
+        ds["time"] = rounded
     assert (
         ds.time.to_index().is_monotonic_increasing
     ), "time must be increasing (please check for duplicate times))"
@@ -142,12 +145,18 @@ class TimeSeries:
 
     @property
     def _val_item(self) -> str:
-        return [
-            str(v)
-            for v in self.data.data_vars
-            if self.data[v].attrs["kind"] == "model"
-            or self.data[v].attrs["kind"] == "observation"
-        ][0]
+        """Name of the primary (model or observation) data variable
+        (cached: the attrs scan is on every values/name access)"""
+        cached = self.__dict__.get("_val_item_cache")
+        if cached is None or cached[0] is not self.data:
+            name = next(
+                str(v)
+                for v in self.data.data_vars
+                if self.data[v].attrs["kind"] in ("model", "observation")
+            )
+            cached = (self.data, name)
+            self.__dict__["_val_item_cache"] = cached
+        return cached[1]
 
     @property
     def name(self) -> str:
@@ -196,6 +205,16 @@ class TimeSeries:
         """Time index"""
         return pd.DatetimeIndex(self.data.time)
 
+    @property
+    def _time_i8(self) -> np.ndarray:
+        """Time axis as int64 nanoseconds (cached: reused when the same
+        object is aligned against several model results)"""
+        cached = self.__dict__.get("_time_i8_cache")
+        if cached is None or cached[0] is not self.data:
+            cached = (self.data, _asi8_ns(self.time))
+            self.__dict__["_time_i8_cache"] = cached
+        return cached[1]
+
     @property
     def x(self) -> Any:  # TODO should this be a float?
         """x-coordinate"""
@@ -224,8 +243,13 @@ class TimeSeries:
 
     @property
     def values(self) -> np.ndarray:
-        """Values as numpy array"""
-        return self.data[self.name].values
+        """Values as numpy array (cached: reused across accesses in
+        scoring/plotting loops; invalidated when the dataset is replaced)"""
+        cached = self.__dict__.get("_values_cache")
+        if cached is None or cached[0] is not self.data:
+            cached = (self.data, self.data[self.name].values)
+            self.__dict__["_values_cache"] = cached
+        return cached[1]
 
     @property
     def _values_as_series(self) -> pd.Series:
@@ -259,7 +283,13 @@ class TimeSeries:
         return len(self.data.time)
 
     def copy(self: T) -> T:
-        return deepcopy(self)
+        # shallow copy + deep-copied dataset; deepcopy(self) would
+        # recurse through all xarray internals via pickle
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__ = self.__dict__.copy()
+        new.data = self.data.copy(deep=True)
+        new.plot = TimeSeries.plotter(new)
+        return new
 
     def equals(self, other: TimeSeries) -> bool:
         """Check if two TimeSeries are equal"""
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import get_args, Optional, List, Sequence
 import warnings
+import numpy as np
 import pandas as pd
 import xarray as xr
 
@@ -10,9 +11,12 @@ import mikeio
 
 from ..types import GeometryType, TrackType
 from ..quantity import Quantity
-from ..utils import _get_name, make_unique_index
+from ..utils import _ensure_datetime_index, _get_name, _get_names, make_unique_index
 from ._timeseries import _validate_data_var_name
 
+# isinstance-ready tuple; get_args allocates a fresh tuple on every call
+_TRACK_TYPES = get_args(TrackType)
+
 
 @dataclass
 class TrackItem:
@@ -51,7 +55,7 @@ def _parse_track_items(
     y_item = _get_name(y_item, valid_names=items)
     if isinstance(aux_items, (str, int)):
         aux_items = [aux_items]
-    aux_items_str = [_get_name(i, valid_names=items) for i in aux_items or []]
+    aux_items_str = _get_names(aux_items or [], valid_names=items)
 
     # check that there are no duplicates
     res = TrackItem(x=x_item, y=y_item, values=item, aux=aux_items_str)
@@ -73,15 +77,26 @@ def _parse_track_input(
     aux_items: Optional[Sequence[int | str]] = None,
 ) -> xr.Dataset:
     assert isinstance(
-        data, get_args(TrackType)
+        data, _TRACK_TYPES
     ), "Could not construct TrackModelResult from provided data."
 
     if isinstance(data, (str, Path)):
         assert Path(data).suffix == ".dfs0", "File must be a dfs0 file"
         name = name or Path(data).stem
-        data = mikeio.read(data)  # now mikeio.Dataset
-    elif isinstance(data, mikeio.Dfs0):
-        data = data.read()  # now mikeio.Dataset
+        data = mikeio.open(data)  # resolve items below, then read
+    if isinstance(data, mikeio.Dfs0):
+        # resolve items against the file header and read only those;
+        # mikeio.read would load every column into memory first
+        sel = _parse_track_items(
+            [i.name for i in data.items],
+            x_item=x_item,
+            y_item=y_item,
+            item=item,
+            aux_items=aux_items,
+        )
+        data = data.read(items=sel.all)  # now mikeio.Dataset
+        x_item, y_item, item = sel.x, sel.y, sel.values
+        aux_items = sel.aux
 
     # parse items
     if isinstance(data, mikeio.Dataset):
@@ -111,6 +126,7 @@ def _parse_track_input(
     if isinstance(data, mikeio.Dataset):
         ds = data.to_xarray()
     elif isinstance(data, pd.DataFrame):
+        data = _ensure_datetime_index(data)
         data.index.name = "time"
         ds = data.to_xarray()
     else:
@@ -135,7 +151,14 @@ def _parse_track_input(
             warnings.warn(
                 f"Removed {n_removed} duplicate timestamps with keep={keep_duplicates}"
             )
-    ds = ds.dropna(dim="time", subset=["x", "y"])
+    # one fused NaN mask over the positions; the gather is skipped
+    # when all positions are valid floats
+    if ds["x"].dtype.kind == "f" and ds["y"].dtype.kind == "f":
+        nan_row = np.isnan(ds["x"].values) | np.isnan(ds["y"].values)
+        if nan_row.any():
+            ds = ds.isel(time=np.flatnonzero(~nan_row))
+    else:
+        ds = ds.dropna(dim="time", subset=["x", "y"])
 
     SPATIAL_DIMS = ["x", "y", "z"]
     for dim in SPATIAL_DIMS:
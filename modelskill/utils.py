@@ -30,21 +30,21 @@ def rename_coords_xr(ds: xr.Dataset) -> xr.Dataset:
     """Rename coordinates to standard names"""
     var_names = [str(name).lower() for name in ds.variables]
 
-    ds = ds.rename(
-        {
-            c: TIME_COORDINATE_NAME_MAPPING[c]
-            for c in var_names
-            if c in TIME_COORDINATE_NAME_MAPPING
-        }
-    )
-    ds = ds.rename(
+    mapping = {
+        c: TIME_COORDINATE_NAME_MAPPING[c]
+        for c in var_names
+        if c in TIME_COORDINATE_NAME_MAPPING and c != TIME_COORDINATE_NAME_MAPPING[c]
+    }
+    mapping.update(
         {
             c: POS_COORDINATE_NAME_MAPPING[c]
             for c in var_names
-            if c in POS_COORDINATE_NAME_MAPPING
+            if c in POS_COORDINATE_NAME_MAPPING and c != POS_COORDINATE_NAME_MAPPING[c]
         }
     )
-    return ds
+    # rename copies the dataset (and for file-backed data a lazy graph);
+    # skip it when all coords already have canonical names
+    return ds.rename(mapping) if mapping else ds
 
 
 def rename_coords_pd(df: pd.DataFrame) -> pd.DataFrame:
@@ -55,16 +55,16 @@ def rename_coords_pd(df: pd.DataFrame) -> pd.DataFrame:
     mapping = {
         c: TIME_COORDINATE_NAME_MAPPING[c]
         for c in col_names
-        if c in TIME_COORDINATE_NAME_MAPPING.keys()
+        if c in TIME_COORDINATE_NAME_MAPPING and c != TIME_COORDINATE_NAME_MAPPING[c]
     }
     mapping.update(
         {
             c: POS_COORDINATE_NAME_MAPPING[c]
             for c in col_names
-            if c in POS_COORDINATE_NAME_MAPPING.keys()
+            if c in POS_COORDINATE_NAME_MAPPING and c != POS_COORDINATE_NAME_MAPPING[c]
         }
     )
-    return df.rename(columns=mapping)
+    return df.rename(columns=mapping) if mapping else df
 
 
 # def get_item_name_and_idx(
@@ -104,6 +104,49 @@ def rename_coords_pd(df: pd.DataFrame) -> pd.DataFrame:
 #         raise TypeError("item must be int or string")
 
 
+def _asi8_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    """Int64 nanosecond view of a time index
+
+    Converts non-nanosecond indexes (pandas >= 2) without the
+    pandas-2-only ``as_unit``; the common ns-resolution case is
+    returned without copying.
+    """
+    if index.dtype == "datetime64[ns]":
+        return index.asi8
+    return index.astype("datetime64[ns]").asi8
+
+
+def _round_100us(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Round a time index to 100us (0.0001s) resolution
+
+    Direct int64 arithmetic instead of DatetimeIndex.round, which
+    dispatches through per-element Timedelta rounding. Returns the
+    index unchanged (no copy) if already on the 100us lattice.
+    Ties round half to even, like DatetimeIndex.round.
+    """
+    vals = _asi8_ns(index)
+    q, r = np.divmod(vals, 100_000)
+    if not r.any():
+        return index
+    up = (r > 50_000) | ((r == 50_000) & (q & 1 == 1))
+    return pd.DatetimeIndex(((q + up) * 100_000).view("M8[ns]"), name=index.name)
+
+
+def _ensure_datetime_index(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce a string (object) index to a DatetimeIndex
+
+    numpy's ISO8601 cast handles the common case much faster than
+    free-form parsing; pd.to_datetime covers the remaining formats.
+    """
+    if df.index.dtype.kind != "O":
+        return df
+    try:
+        idx = pd.DatetimeIndex(df.index.to_numpy().astype("M8[ns]"))
+    except (ValueError, TypeError):
+        idx = pd.to_datetime(df.index, cache=True)
+    return df.set_axis(idx)
+
+
 def is_iterable_not_str(obj):
     """Check if an object is an iterable but not a string."""
     if isinstance(obj, str):
@@ -161,6 +204,26 @@ def _get_name(x: int | str | None, valid_names: Sequence[str]) -> str:
     return valid_names[_get_idx(x, valid_names)]
 
 
+def _get_names(
+    xs: Sequence[int | str | None], valid_names: Sequence[str]
+) -> list[str]:
+    """Resolve several names/indices against valid_names in one pass
+
+    A single name set replaces the per-item list scan of _get_name;
+    matters for wide dfs0 files with many aux items.
+    """
+    known = set(valid_names)
+    names = []
+    for x in xs:
+        if isinstance(x, str):
+            if x not in known:
+                raise KeyError(f"Name {x} could not be found in {valid_names}")
+            names.append(x)
+        else:
+            names.append(valid_names[_get_idx(x, valid_names)])
+    return names
+
+
 def _get_idx(x: int | str | None, valid_names: Sequence[str]) -> int:
     """Parse name/idx from list of valid names (e.g. obs from obs_names), return idx"""
 
@@ -6,19 +6,25 @@ import pandas as pd
 import modelskill as ms
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ERA5_DutchCoast_nc():
     return "tests/testdata/SW/ERA5_DutchCoast.nc"
 
 
+@pytest.fixture(scope="module")
+def ERA5_ds(ERA5_DutchCoast_nc):
+    # open once per module; tests only derive new objects from it
+    return xr.open_dataset(ERA5_DutchCoast_nc)
+
+
 @pytest.fixture
-def mr_ERA5_pp1d(ERA5_DutchCoast_nc):
-    return ms.model_result(ERA5_DutchCoast_nc, name="ERA5_DutchCoast", item="pp1d")
+def mr_ERA5_pp1d(ERA5_ds):
+    return ms.model_result(ERA5_ds, name="ERA5_DutchCoast", item="pp1d")
 
 
 @pytest.fixture
-def mr_ERA5_swh(ERA5_DutchCoast_nc):
-    return ms.model_result(ERA5_DutchCoast_nc, name="ERA5_DutchCoast", item="swh")
+def mr_ERA5_swh(ERA5_ds):
+    return ms.model_result(ERA5_ds, name="ERA5_DutchCoast", item="swh")
 
 
 @pytest.fixture
@@ -48,8 +54,8 @@ def test_grid_from_nc(mr_ERA5_pp1d):
     assert mr.time[-1] == datetime(2017, 10, 29, 18, 0, 0)
 
 
-def test_grid_from_DataArray(ERA5_DutchCoast_nc):
-    ds = xr.open_dataset(ERA5_DutchCoast_nc)
+def test_grid_from_DataArray(ERA5_ds):
+    ds = ERA5_ds
     mr = ms.GridModelResult(ds["swh"])
     assert mr.quantity.name == "Significant height of combined wind waves and swell"
     assert mr.quantity.unit == "m"
@@ -61,17 +67,15 @@ def test_grid_from_DataArray(ERA5_DutchCoast_nc):
     assert mr2.quantity.unit == "meter"
 
 
-def test_dataset_with_missing_coordinates(ERA5_DutchCoast_nc):
-    ds = xr.open_dataset(ERA5_DutchCoast_nc)
-    ds = ds.drop_vars(["longitude"])  # remove one of the coordinates
+def test_dataset_with_missing_coordinates(ERA5_ds):
+    ds = ERA5_ds.drop_vars(["longitude"])  # remove one of the coordinates
 
     with pytest.raises(ValueError, match="gtype"):
         ms.model_result(ds["swh"])
 
 
-def test_grid_from_da(ERA5_DutchCoast_nc):
-    ds = xr.open_dataset(ERA5_DutchCoast_nc)
-    da = ds["swh"]
+def test_grid_from_da(ERA5_ds):
+    da = ERA5_ds["swh"]
     mr = ms.model_result(da)
 
     assert isinstance(mr, ms.GridModelResult)
@@ -97,36 +101,36 @@ def test_grid_name(ERA5_DutchCoast_nc):
     assert mri1.name == mri2.name
 
 
-def test_grid_aux_items(ERA5_DutchCoast_nc):
-    mr = ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items=["swh"])
+def test_grid_aux_items(ERA5_ds):
+    mr = ms.GridModelResult(ERA5_ds, item="pp1d", aux_items=["swh"])
     assert mr.sel_items.values == "pp1d"
     assert mr.sel_items.aux == ["swh"]
     assert list(mr.data.data_vars) == ["pp1d", "swh"]
 
-    mr = ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items=["swh", "mwp"])
+    mr = ms.GridModelResult(ERA5_ds, item="pp1d", aux_items=["swh", "mwp"])
     assert mr.sel_items.values == "pp1d"
     assert mr.sel_items.aux == ["swh", "mwp"]
     assert list(mr.data.data_vars) == ["pp1d", "swh", "mwp"]
 
     # accept string instead of list
-    mr = ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items="swh")
+    mr = ms.GridModelResult(ERA5_ds, item="pp1d", aux_items="swh")
     assert mr.sel_items.values == "pp1d"
     assert mr.sel_items.aux == ["swh"]
     assert list(mr.data.data_vars) == ["pp1d", "swh"]
 
     # use index instead of name
-    mr = ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items=[4, 1])
+    mr = ms.GridModelResult(ERA5_ds, item="pp1d", aux_items=[4, 1])
     assert mr.sel_items.values == "pp1d"
     assert mr.sel_items.aux == ["swh", "mwp"]
     assert list(mr.data.data_vars) == ["pp1d", "swh", "mwp"]
 
 
-def test_grid_aux_items_fail(ERA5_DutchCoast_nc):
+def test_grid_aux_items_fail(ERA5_ds):
     with pytest.raises(ValueError, match="Duplicate items"):
-        ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items=["swh", "pp1d"])
+        ms.GridModelResult(ERA5_ds, item="pp1d", aux_items=["swh", "pp1d"])
 
     with pytest.raises(ValueError, match="Duplicate items"):
-        ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items=["swh", "swh"])
+        ms.GridModelResult(ERA5_ds, item="pp1d", aux_items=["swh", "swh"])
 
 
 # def test_grid_itemInfo(ERA5_DutchCoast_nc):
@@ -150,12 +154,31 @@ def test_grid_extract_point(mr_ERA5_swh, pointobs_epl_hm0):
     assert pmr.time[-1] == datetime(2017, 10, 29, 18, 0, 0)
     assert pmr.n_points == 67
     assert len(pmr.data.data_vars) == 1
-    assert pytest.approx(pmr.data.to_pandas().iloc[0, 0]) == 0.847677
+    assert pytest.approx(pmr.values[0]) == 0.847677
 
     # default spatial_method='linear'
     pmr2 = mr_ERA5_swh.extract(pointobs_epl_hm0, spatial_method="nearest")
     assert pmr2.n_points == 67
-    assert pytest.approx(pmr2.data.to_pandas().iloc[0, 0]) == 0.875528
+    assert pytest.approx(pmr2.values[0]) == 0.875528
+
+
+def test_grid_extract_points(mr_ERA5_swh, pointobs_epl_hm0):
+    obs2 = ms.PointObservation(
+        "tests/testdata/SW/HKNA_Hm0.dfs0", item=0, x=4.2420, y=52.6887, name="HKNA"
+    )
+    pmrs = mr_ERA5_swh.extract_points([pointobs_epl_hm0, obs2])
+    assert len(pmrs) == 2
+    for pmr, obs in zip(pmrs, [pointobs_epl_hm0, obs2]):
+        single = mr_ERA5_swh.extract(obs)
+        assert pmr.name == single.name
+        # batched interp may differ from the scalar call in the last ulp
+        xr.testing.assert_allclose(pmr.data, single.data)
+
+
+def test_grid_extract_points_outside(mr_ERA5_swh, pointobs_epl_hm0):
+    pointobs_epl_hm0.x = -50
+    with pytest.raises(ValueError, match="outside"):
+        mr_ERA5_swh.extract_points([pointobs_epl_hm0])
 
 
 def test_grid_extract_point_xoutside(mr_ERA5_pp1d, pointobs_epl_hm0):
@@ -165,17 +188,16 @@ def test_grid_extract_point_xoutside(mr_ERA5_pp1d, pointobs_epl_hm0):
         mri.extract(pointobs_epl_hm0)
 
 
-def test_grid_extract_point_toutside(ERA5_DutchCoast_nc, pointobs_epl_hm0):
-    ds = xr.open_dataset(ERA5_DutchCoast_nc)
-    da = ds["swh"].isel(time=slice(10, 15))
+def test_grid_extract_point_toutside(ERA5_ds, pointobs_epl_hm0):
+    da = ERA5_ds["swh"].isel(time=slice(10, 15))
     da["time"] = pd.Timedelta("365D") + da.time
     mr = ms.GridModelResult(da)
     with pytest.warns(UserWarning, match="outside"):
         mr.extract(pointobs_epl_hm0)
 
 
-def test_grid_extract_point_aux(ERA5_DutchCoast_nc, pointobs_epl_hm0):
-    mr = ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items=["swh"])
+def test_grid_extract_point_aux(ERA5_ds, pointobs_epl_hm0):
+    mr = ms.GridModelResult(ERA5_ds, item="pp1d", aux_items=["swh"])
     pc = mr.extract(pointobs_epl_hm0)
     assert isinstance(pc, ms.PointModelResult)
     assert pc.time[0] == datetime(2017, 10, 27, 0, 0, 0)
@@ -202,8 +224,8 @@ def test_grid_extract_track(mr_ERA5_pp1d, trackobs_c2_hm0):
     assert tmr.n_points == 99
 
 
-def test_grid_extract_track_aux(ERA5_DutchCoast_nc, trackobs_c2_hm0):
-    mr = ms.GridModelResult(ERA5_DutchCoast_nc, item="pp1d", aux_items=["swh"])
+def test_grid_extract_track_aux(ERA5_ds, trackobs_c2_hm0):
+    mr = ms.GridModelResult(ERA5_ds, item="pp1d", aux_items=["swh"])
     tc = mr.extract(trackobs_c2_hm0)
     assert isinstance(tc, ms.TrackModelResult)
     assert tc.time[0].strftime("%Y-%m-%dT%H:%M:%S") == "2017-10-27T12:52:52"
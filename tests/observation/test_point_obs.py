@@ -6,26 +6,33 @@ import mikeio
 import modelskill as ms
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def klagshamn_filename():
     return "tests/testdata/smhi_2095_klagshamn_200.dfs0"
 
 
+@pytest.fixture(scope="module")
+def klagshamn_raw(klagshamn_filename):
+    # read the dfs0 once per module; the fixtures below derive
+    # per-test views from the in-memory dataset
+    return mikeio.read(klagshamn_filename)
+
+
 @pytest.fixture
-def klagshamn_df(klagshamn_filename):
-    return mikeio.read(klagshamn_filename).to_dataframe()
+def klagshamn_df(klagshamn_raw):
+    return klagshamn_raw.to_dataframe()
 
 
 @pytest.fixture
-def klagshamn_da(klagshamn_filename):
-    da = mikeio.read(klagshamn_filename)["Water Level"]
+def klagshamn_da(klagshamn_raw):
+    da = klagshamn_raw["Water Level"]
     assert isinstance(da, mikeio.DataArray)
     return da
 
 
 @pytest.fixture
-def klagshamn_ds(klagshamn_filename):
-    return mikeio.read(klagshamn_filename)
+def klagshamn_ds(klagshamn_raw):
+    return klagshamn_raw
 
 
 @pytest.fixture
@@ -142,6 +149,18 @@ def test_force_keyword_args(klagshamn_filename):
         ms.PointObservation(klagshamn_filename, 0, 366844, 6154291, "Klagshamn")
 
 
+def test_cache(klagshamn_filename, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    o1 = ms.PointObservation(klagshamn_filename, item=0, cache=True)
+    cache_files = list((tmp_path / "modelskill").glob("*.pkl"))
+    assert len(cache_files) == 1
+
+    # second load hits the cache
+    o2 = ms.PointObservation(klagshamn_filename, item=0, cache=True)
+    assert o2.data.equals(o1.data)
+
+
 def test_point_data_can_be_persisted_as_netcdf(klagshamn_filename, tmp_path):
     p = ms.PointObservation(klagshamn_filename)
 
@@ -187,6 +187,13 @@ def test_read(c2):
     assert "y" in o1.data
 
 
+def test_from_files(c2):
+    obs = ms.TrackObservation.from_files([c2, c2], item=2)
+    assert len(obs) == 2
+    assert all(o.n_points == 299 for o in obs)
+    assert obs[0].equals(obs[1])
+
+
 def test_from_df():
     n = 5
 
@@ -315,6 +322,14 @@ def test_track_attrs_not_allowed(obs_tiny_df4):
         ms.PointObservation(obs_tiny_df4, item="alti", attrs={"gtype": "v1"})
 
 
+def test_track_coord_dtype(obs_tiny_df4):
+    o = ms.TrackObservation(obs_tiny_df4, item="alti", coord_dtype=np.float32)
+    assert o.data.x.dtype == np.float32
+    assert o.data.y.dtype == np.float32
+    np.testing.assert_allclose(o.data.x.values, obs_tiny_df4.x.values, rtol=1e-6)
+    np.testing.assert_allclose(o.data.y.values, obs_tiny_df4.y.values, rtol=1e-6)
+
+
 def test_track_aux_items(df_aux):
     o = ms.TrackObservation(
         df_aux, item="WL", x_item="x", y_item="y", aux_items=["aux1"]
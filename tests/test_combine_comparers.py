@@ -3,37 +3,37 @@ import pytest
 import modelskill as ms
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mrmike():
     fn = "tests/testdata/SW/HKZN_local_2017_DutchCoast.dfsu"
     return ms.model_result(fn, name="SW_1", item=0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mrmike2():
     fn = "tests/testdata/SW/HKZN_local_2017_DutchCoast_v2.dfsu"
     return ms.model_result(fn, name="SW_2", item=0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mr2days():
     fn = "tests/testdata/SW/CMEMS_DutchCoast_*.nc"
     return ms.model_result(fn, name="CMEMS", item="VHM0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mr28():
     fn = "tests/testdata/SW/CMEMS_DutchCoast_2017-10-28.nc"
     return ms.model_result(fn, name="CMEMS", item="VHM0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mr29():
     fn = "tests/testdata/SW/CMEMS_DutchCoast_2017-10-29.nc"
     return ms.model_result(fn, name="CMEMS", item="VHM0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def o123():
     fn = "tests/testdata/SW/HKNA_Hm0.dfs0"
     o1 = ms.PointObservation(fn, item=0, x=4.2420, y=52.6887, name="HKNA")
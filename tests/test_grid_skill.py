@@ -5,37 +5,38 @@ import xarray as xr
 import modelskill as ms
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cmp1() -> ms.Comparer:
     fn = "tests/testdata/NorthSeaHD_and_windspeed.dfsu"
     mr = ms.model_result(fn, item=0, name="HD")
     fn = "tests/testdata/altimetry_NorthSea_20171027.csv"
-    df = pd.read_csv(fn, index_col=0, parse_dates=True)
+    df = pd.read_csv(fn, index_col=0)
+    df.index = pd.to_datetime(df.index, format="%Y-%m-%d %H:%M:%S")
     with pytest.warns(UserWarning, match="Removed 22 duplicate timestamps"):
         o1 = ms.TrackObservation(df, item=2, name="alti")
 
     return ms.match(o1, mr)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def o1() -> ms.PointObservation:
     fn = "tests/testdata/SW/HKNA_Hm0.dfs0"
     return ms.PointObservation(fn, item=0, x=4.2420, y=52.6887, name="HKNA")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def o2() -> ms.PointObservation:
     fn = "tests/testdata/SW/eur_Hm0.dfs0"
     return ms.PointObservation(fn, item=0, x=3.2760, y=51.9990, name="EPL")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def o3() -> ms.TrackObservation:
     fn = "tests/testdata/SW/Alti_c2_Dutch.dfs0"
     return ms.TrackObservation(fn, item=3, name="c2")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cc2(o1, o2, o3) -> ms.ComparerCollection:
     fn = "tests/testdata/SW/HKZN_local_2017_DutchCoast.dfsu"
     mr1 = ms.model_result(fn, item=0, name="SW_1")
@@ -88,6 +88,15 @@ def test_match_multi_obs_multi_model(o1, o2, o3, mr1, mr2):
     assert cc["HKNA"].name == "HKNA"
 
 
+def test_match_n_workers(o1, o2, o3, mr1, mr2):
+    cc = ms.match([o1, o2, o3], [mr1, mr2])
+    cc_par = ms.match([o1, o2, o3], [mr1, mr2], n_workers=2)
+    assert cc_par.n_models == cc.n_models
+    assert [c.name for c in cc_par] == [c.name for c in cc]
+    for c, c_par in zip(cc, cc_par):
+        assert c_par.data.equals(c.data)
+
+
 def test_match_dataarray(o1, o3):
     fn = "tests/testdata/SW/HKZN_local_2017_DutchCoast.dfsu"
     da = mikeio.read(fn, time=slice("2017-10-28 00:00", None))[0]  # Skip warm-up period